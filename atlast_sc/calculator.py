@@ -1,3 +1,4 @@
+import functools
 import warnings
 import astropy.units as u
 from astropy.constants import k_B
@@ -15,6 +16,21 @@ from atlast_sc.utils import DataHelper
 from atlast_sc.exceptions import CalculatedValueInvalidWarning
 from atlast_sc.exceptions import ValueOutOfRangeException
 
+# 2*k_B in J/K, as a plain float for use in the SEFD calculations
+_TWO_KB = float((2 * k_B).to(u.J / u.K).value)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_atm():
+    """
+    Get the atmospheric model. This is built once and shared by all
+    calculators, since it only depends on the static lookup tables.
+
+    :return: the atmospheric model
+    :rtype: atlast_sc.derived_groups.AtmosphereParams
+    """
+    return AtmosphereParams()
+
 
 class Calculator:
     """
@@ -28,6 +44,15 @@ class Calculator:
      **NB: usage not tested, and may not be supported in future.**
     :type instrument_setup: dict
     """
+
+    # Units used to display calculated sensitivities and integration times,
+    # and the thresholds at which to switch from one unit to the next
+    # (in the units of the first threshold)
+    _SENSITIVITY_UNITS = (u.uJy, u.mJy, u.Jy)
+    _SENSITIVITY_THRESHOLDS = np.array([1.0, 1000.0]) * u.mJy
+    _T_INT_UNITS = (u.s, u.min, u.h)
+    _T_INT_THRESHOLDS = np.array([60.0, 3600.0]) * u.s
+
     def __init__(self, user_input={}, instrument_setup={}, finetune=False):
         self._finetune = finetune
 
@@ -45,6 +70,10 @@ class Calculator:
        
         derived_params =  self._calculate_derived_parameters()
         self._dp = DerivedParameters(derived_params, self._config)
+        # Set when an input to the derived parameters changes; they are
+        # then recalculated on the next sensitivity or integration time
+        # calculation
+        self._dp_dirty = False
 
         self.sensitivity = self._uip.sensitivity
     #################################################
@@ -76,18 +105,16 @@ class Calculator:
         else:
             t_int = self._uip.t_int
 
+        self._update_derived_parameters()
+
         sensitivity = \
             self._dp.sefd / \
-            (self._dp.eta_s * np.sqrt(self._uip.n_pol * self._uip.bandwidth * t_int))
+            (self._dp.eta_s * np.sqrt(self._uip.n_pol_bandwidth * t_int))
 
         # Convert the output to the most convenient units
-        sensitivityresult = sensitivity.to(u.mJy)
-        if  sensitivityresult < 1*u.mJy:
-            sensitivity = sensitivity.to(u.uJy)
-        elif (sensitivityresult >= 1*u.mJy) & (sensitivityresult < 1000*u.mJy):
-            sensitivity = sensitivity.to(u.mJy)
-        elif sensitivityresult >= 1000*u.mJy:
-            sensitivity = sensitivity.to(u.Jy)
+        sensitivity = Calculator._to_convenient_unit(
+            sensitivity, Calculator._SENSITIVITY_UNITS,
+            Calculator._SENSITIVITY_THRESHOLDS)
 
         # Try to update the sensitivity stored in the calculator
         if update_calculator:
@@ -129,17 +156,14 @@ class Calculator:
         else:
             sensitivity = self.sensitivity
 
+        self._update_derived_parameters()
+
         t_int = (self._dp.sefd / (sensitivity * self._dp.eta_s)) ** 2 \
-            / (self._uip.n_pol * self._uip.bandwidth)
+            / self._uip.n_pol_bandwidth
 
         # Convert the output to the most convenient units
-        timeresult = t_int.to(u.s)
-        if  timeresult < 60*u.s:
-            t_int = t_int.to(u.s)
-        elif (timeresult >= 60*u.s) & (timeresult < 3600*u.s):
-            t_int = t_int.to(u.min)
-        elif timeresult >= 3600*u.s:
-            t_int = t_int.to(u.h)
+        t_int = Calculator._to_convenient_unit(
+            t_int, Calculator._T_INT_UNITS, Calculator._T_INT_THRESHOLDS)
 
         # Try to update the integration time stored in the calculator
         if update_calculator:
@@ -151,6 +175,51 @@ class Calculator:
 
         return t_int
 
+    def calculate_sensitivity_batch(self, t_int):
+        """
+        Calculates the telescope sensitivity for each of an array of
+        integration times, e.g., for parameter scans. Unlike
+        `calculate_sensitivity`, the integration times are not validated,
+        and the calculator is not updated.
+
+        :param t_int: array of integration times
+        :type t_int: astropy.units.Quantity
+        :return: array of sensitivities in mJy
+        :rtype: astropy.units.Quantity
+        """
+
+        t_int = u.Quantity(t_int)
+
+        self._update_derived_parameters()
+
+        sensitivity = \
+            self._dp.sefd / \
+            (self._dp.eta_s * np.sqrt(self._uip.n_pol_bandwidth * t_int))
+
+        return sensitivity.to(u.mJy)
+
+    def calculate_t_integration_batch(self, sensitivity):
+        """
+        Calculates the integration time required to reach each of an array
+        of sensitivities, e.g., for parameter scans. Unlike
+        `calculate_t_integration`, the sensitivities are not validated,
+        and the calculator is not updated.
+
+        :param sensitivity: array of required sensitivities
+        :type sensitivity: astropy.units.Quantity
+        :return: array of integration times in seconds
+        :rtype: astropy.units.Quantity
+        """
+
+        sensitivity = u.Quantity(sensitivity)
+
+        self._update_derived_parameters()
+
+        t_int = (self._dp.sefd / (sensitivity * self._dp.eta_s)) ** 2 \
+            / self._uip.n_pol_bandwidth
+
+        return t_int.to(u.s)
+
     ###################
     # Utility methods #
     ###################
@@ -161,8 +230,9 @@ class Calculator:
         """
         # Reset the config calculation inputs to their original values
         self._config.reset()
-        # Recalculate the derived parameters
-        self._calculate_derived_parameters()
+        self._uip._clear_n_pol_bandwidth()
+        # Recalculate the derived parameters when they are next needed
+        self._dp_dirty = True
 
     #####################
     # Protected methods #
@@ -184,6 +254,21 @@ class Calculator:
             if param not in test_model.__dict__:
                 raise ValueError(f'"{param}" is not a valid input parameter')
 
+    def _update_derived_parameters(self):
+        """
+        Recalculates the derived parameters if any of their inputs have
+        changed since they were last calculated.
+        """
+        # The setters for the inputs to the derived parameters live on the
+        # user input and instrument setup parameter objects, so check the
+        # flags set on those too
+        if self._dp_dirty or self._uip._dp_dirty or self._isp._dp_dirty:
+            derived_params = self._calculate_derived_parameters()
+            self._dp = DerivedParameters(derived_params, self._config)
+            self._dp_dirty = False
+            self._uip._dp_dirty = False
+            self._isp._dp_dirty = False
+
     def _calculate_derived_parameters(self):
         """
         Performs the calculations required to produce the
@@ -207,20 +292,32 @@ class Calculator:
         # build of DerivedParams below
         # ------------------------------------------------------------------
 
+        # Read the inputs used below once, rather than going through the
+        # config models on every access
+        obs_freq = self._uip.obs_freq
+        weather = self._uip.weather
+        elevation = self._uip.elevation
+
+        # Cache the constant factor 2*k_B/dish_area (J/K/m2) used in the
+        # SEFD calculations. This is refreshed here since the derived
+        # parameters are recalculated whenever the dish radius changes
+        dish_area = np.pi * self._isp.dish_radius.to('m').value**2
+        self._two_kB_over_area = _TWO_KB / dish_area
+
         # Perform efficiencies calculations
-        
-        eta = Efficiencies(self._uip.obs_freq , self._isp.surface_rms, self._isp.eta_ill,
+
+        eta = Efficiencies(obs_freq , self._isp.surface_rms, self._isp.eta_ill,
                            self._isp.eta_spill, self._isp.eta_block, self._isp.eta_pol)
 
         # Perform atmospheric model calculations
-        atm = AtmosphereParams()
-        tau_atm = atm.calculate_tau_atm(self._uip.obs_freq,
-                                        self._uip.weather, self._uip.elevation)
-        T_atm = atm.calculate_atmospheric_temperature(self._uip.obs_freq,
-                                                      self._uip.weather)
+        atm = _get_atm()
+        tau_atm = atm.calculate_tau_atm(obs_freq,
+                                        weather, elevation)
+        T_atm = atm.calculate_atmospheric_temperature(obs_freq,
+                                                      weather)
 
         # Calculate the temperatures
-        temps = Temperatures(self._uip.obs_freq, self._isp.T_cmb, self._isp.T_amb, self._isp.g,
+        temps = Temperatures(obs_freq, self._isp.T_cmb, self._isp.T_amb, self._isp.g,
                              self._isp.eta_eff, T_atm, tau_atm)
 
         # LDM
@@ -234,16 +331,19 @@ class Calculator:
         # Setting finetune=False will fall back on the old implementation
         # ------------------------------------------------------------------
 
+        # plain floats used for the band integration below, to avoid the
+        # overhead of Quantity arithmetic on the channel arrays. Frequencies
+        # are in GHz to match the atm tables, everything else is in SI units
+        obs_freq_ghz = obs_freq.to('GHz').value
+        bandwidth_ghz = self._uip.bandwidth.to('GHz').value
+
         # define lower and upper limit of the requested band
-        obs_freq_low = (self._uip.obs_freq-0.50*self._uip.bandwidth).to('GHz').value
-        obs_freq_upp = (self._uip.obs_freq+0.50*self._uip.bandwidth).to('GHz').value
+        obs_freq_low = obs_freq_ghz - 0.50*bandwidth_ghz
+        obs_freq_upp = obs_freq_ghz + 0.50*bandwidth_ghz
 
-        # select all the frequencies in the atm tables comprised within the band edges
-        obs_freq_list = atm.tau_atm_table[:, 0][np.logical_and(atm.tau_atm_table[:, 0]>obs_freq_low,
-                                                               atm.tau_atm_table[:, 0]<obs_freq_upp)]
-       
-        # pad the frequency array to include the lower/upper band edges 
-        obs_freq_list = np.concatenate(([obs_freq_low],obs_freq_list,[obs_freq_upp]))*u.GHz
+        # select all the frequencies in the atm tables comprised within the
+        # band edges, padded to include the lower/upper band edges
+        obs_freq_list = atm.band_frequencies(obs_freq_low, obs_freq_upp)
 
         # double the frequency resolution; turned off for the moment, but
         # just wanted to keep track of this
@@ -254,25 +354,24 @@ class Calculator:
         # check if there are enough channels for performing the sum,
         # otherwise estimate the single-frequency SEFD
         if self._finetune and len(obs_freq_list)>1:
-            
-            _sefd = []
-            
+
             obs_band_list = (obs_freq_list[1:]-obs_freq_list[:-1])
             obs_freq_list = (obs_freq_list[1:]+obs_freq_list[:-1])*0.50
 
-            # compute SEFD for each narrow spectral element
-            for freq in obs_freq_list:
-                _tau_atm = atm.calculate_tau_atm(freq,self._uip.weather,self._uip.elevation)
-
-                _T_atm = atm.calculate_atmospheric_temperature(freq,self._uip.weather)
-                _temps = Temperatures(freq, self._isp.T_cmb, self._isp.T_amb, self._isp.g,
-                                      self._isp.eta_eff, _T_atm, _tau_atm)
-
-                _sefd.append(self._calculate_sefd(_temps.T_sys,eta.eta_a).to('J/m2').value)
-            _sefd = np.asarray(_sefd)*(u.J/u.m**2)
+            # compute SEFD for all the narrow spectral elements at once
+            _tau_atm = atm.calculate_tau_atm(obs_freq_list, weather,
+                                             elevation)
+            _T_atm = atm.calculate_atmospheric_temperature(obs_freq_list,
+                                                           weather)
+            _T_sys = Temperatures.calculate_system_temperature(
+                obs_freq_list, self._isp.T_cmb.to('K').value,
+                self._isp.T_amb.to('K').value, self._isp.g, self._isp.eta_eff,
+                _T_atm.to('K').value, _tau_atm)
 
             # obtain the effective SEFD for the input band
-            sefd = np.sqrt(self._uip.bandwidth/np.sum(obs_band_list/_sefd**2))
+            sefd = Calculator._calculate_sefd_band(_T_sys,
+                                                   obs_band_list, eta.eta_a,
+                                                   self._two_kB_over_area, bandwidth_ghz) * (u.J/u.m**2)
         else:
             sefd = self._calculate_sefd(temps.T_sys, eta.eta_a)
 
@@ -296,10 +395,58 @@ class Calculator:
         :rtype: astropy.units.Quantity
         """
 
-        dish_area = np.pi * self._isp.dish_radius ** 2
-        sefd = (2 * k_B * T_sys) / (eta_a * dish_area)
+        sefd = self._two_kB_over_area * T_sys.to('K').value / eta_a
+
+        return sefd * (u.J / u.m**2)
+
+    @staticmethod
+    def _calculate_sefd_band(T_sys, obs_band_list, eta_a, two_kB_over_area,
+                             bandwidth):
+        """
+        Calculates the effective SEFD of a band made up of narrow channels,
+        sefd = sqrt(dnu / sum(dnu_i / sefd_i**2)). All the inputs are
+        plain floats, or arrays of floats, in SI units (the channel widths
+        and the bandwidth just need to be in the same units).
+
+        :param T_sys: system temperature of each channel in K
+        :type T_sys: numpy.ndarray
+        :param obs_band_list: width of each channel
+        :type obs_band_list: numpy.ndarray
+        :param eta_a: the dish efficiency factor
+        :type eta_a: float
+        :param two_kB_over_area: the factor 2*k_B/dish_area in J/K/m2
+        :type two_kB_over_area: float
+        :param bandwidth: the total bandwidth
+        :type bandwidth: float
+        :return: effective source equivalent flux density in J/m2
+        :rtype: float
+        """
+
+        sefd = two_kB_over_area * T_sys / eta_a
+
+        return np.sqrt(bandwidth / np.sum(obs_band_list / sefd**2))
+
+    @staticmethod
+    def _to_convenient_unit(value, units, thresholds):
+        """
+        Converts a calculated value to the most convenient of `units`:
+        `units[i]` is used for values below `thresholds[i]`, and the last
+        unit for values above the last threshold.
+
+        :param value: the value to convert
+        :type value: astropy.units.Quantity
+        :param units: candidate units, in increasing order of size
+        :type units: tuple[astropy.units.Unit]
+        :param thresholds: values at which to switch to the next unit
+        :type thresholds: astropy.units.Quantity
+        :return: the converted value
+        :rtype: astropy.units.Quantity
+        """
+        index = np.searchsorted(thresholds.value,
+                                value.to(thresholds.unit).value,
+                                side='right')
 
-        return sefd
+        return value.to(units[index])
 
     @staticmethod
     def _calculated_value_error_msg(calculated_value, validation_error):
@@ -22,15 +22,14 @@ class Config:
         :type instrument_setup: dict
         """
 
-        new_user_input = UserInput(**user_input)
-        new_instrument_setup = InstrumentSetup(**instrument_setup)
         self._calculation_inputs = \
-            CalculationInput(user_input=new_user_input,
-                             instrument_setup=new_instrument_setup)
+            Config._create_calculation_inputs(user_input, instrument_setup)
 
-        # Make a deep copy of the calculation inputs to enable the
-        # calculator to be reset to its initial setup
-        self._original_inputs = copy.deepcopy(self._calculation_inputs)
+        # Keep a copy of the original user input and instrument setup to
+        # enable the calculator to be reset to its initial setup (these are
+        # small dictionaries, so a deep copy is cheap)
+        self._original_user_input = copy.deepcopy(user_input)
+        self._original_instrument_setup = copy.deepcopy(instrument_setup)
 
     @property
     def calculation_inputs(self):
@@ -46,4 +45,24 @@ class Config:
         instrument setup to their original values.
         """
         self._calculation_inputs = \
-            self._original_inputs
+            Config._create_calculation_inputs(self._original_user_input,
+                                              self._original_instrument_setup)
+
+    @staticmethod
+    def _create_calculation_inputs(user_input, instrument_setup):
+        """
+        Creates the calculation inputs from the user input and instrument
+        setup dictionaries.
+
+        :param user_input: A dictionary of user inputs
+        :type user_input: dict
+        :param instrument_setup: A dictionary of instrument setup parameters
+        :type instrument_setup: dict
+        :return: the calculation inputs
+        :rtype: atlast_sc.models.CalculationInput
+        """
+        new_user_input = UserInput(**user_input)
+        new_instrument_setup = InstrumentSetup(**instrument_setup)
+
+        return CalculationInput(user_input=new_user_input,
+                                instrument_setup=new_instrument_setup)
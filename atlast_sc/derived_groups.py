@@ -1,5 +1,5 @@
+import functools
 from pathlib import Path
-from scipy.interpolate import RegularGridInterpolator
 import numpy as np
 import astropy.units as u
 from astropy import constants
@@ -23,51 +23,158 @@ class AtmosphereParams:
 
     def __init__(self):
 
-        self.T_atm_table = np.genfromtxt(AtmosphereParams._T_ATM_PATH)
-        self.tau_atm_table = np.genfromtxt(AtmosphereParams._TAU_ATM_PATH)
+        # The processed lookup tables are only built once, and are shared
+        # between instances
+        self.T_atm_table, self.tau_atm_table = AtmosphereParams._load_tables()
+        # Frequency column of the tables (GHz), used to select the
+        # frequencies within a band
+        self._table_freqs = np.ascontiguousarray(self.tau_atm_table[:, 0])
+
+        # Per-weather columns of the tables, for interpolating over frequency
+        self._T_atm_by_weather = \
+            AtmosphereParams._columns_by_weather(self.T_atm_table)
+        self._tau_atm_by_weather = \
+            AtmosphereParams._columns_by_weather(self.tau_atm_table)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_tables():
+        """
+        Read the T_atm and tau_atm lookup tables from disk and rescale the
+        temperatures. The result is cached, and marked as read-only since
+        it is shared between instances. Only the processed tables are kept.
+        The tables are stored column-major, so that each column can be used
+        for interpolation without being copied.
+
+        :return: the T_atm and tau_atm lookup tables
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        T_atm_table = \
+            np.asfortranarray(np.genfromtxt(AtmosphereParams._T_ATM_PATH))
+        tau_atm_table = \
+            np.asfortranarray(np.genfromtxt(AtmosphereParams._TAU_ATM_PATH))
         # the temperature values obtained by interpolating over the ATM tables are rescaled by the opacity at zenith to obtain T_atm (see the discussion around Eq. 7-9 in the ALMA Memo 602 (https://library.nrao.edu/public/memos/alma/main/memo602.pdf))
-        self.T_atm_table[:,1:] = self.T_atm_table[:,1:] / (1.00 - np.exp(-self.tau_atm_table[:,1:]))
+        T_atm_table[:,1:] = T_atm_table[:,1:] / (1.00 - np.exp(-tau_atm_table[:,1:]))
+
+        T_atm_table.flags.writeable = False
+        tau_atm_table.flags.writeable = False
 
-        self._interp_T_atm = RegularGridInterpolator((self.T_atm_table[:, 0],
-                                                      AtmosphereParams._WEATHER),
-                                                      self.T_atm_table[:, 1:])
+        return T_atm_table, tau_atm_table
+
+    @staticmethod
+    def _columns_by_weather(table):
+        """
+        Split a lookup table into one contiguous column per weather value.
+        The columns are views if the table is column-major.
+
+        :param table: the lookup table
+        :type table: numpy.ndarray
+        :return: dictionary of table columns keyed by weather value
+        :rtype: dict[int, numpy.ndarray]
+        """
+        return {weather: np.ascontiguousarray(table[:, i + 1])
+                for i, weather in enumerate(AtmosphereParams._WEATHER)}
 
-        self._interp_tau_atm = RegularGridInterpolator((self.tau_atm_table[:, 0],
-                                                        AtmosphereParams._WEATHER),
-                                                        self.tau_atm_table[:, 1:])
+    def _interpolate(self, columns, obs_freq, weather):
+        """
+        Bilinear interpolation over frequency and weather: the columns for
+        the two weather values either side of `weather` are interpolated
+        over frequency, and the results are then interpolated over weather.
+
+        :param columns: per-weather table columns
+        :type columns: dict[int, numpy.ndarray]
+        :param obs_freq: the observing frequency, or an array of frequencies
+        :type obs_freq: astropy.units.Quantity or float (GHz)
+        :param weather: the precipitable water vapour
+        :type weather: float
+        :return: the interpolated value(s)
+        :rtype: float or numpy.ndarray
+        """
+        obs_freq = u.Quantity(obs_freq, u.GHz).value
+        weathers = AtmosphereParams._WEATHER
+
+        if np.any(obs_freq < self._table_freqs[0]) or \
+                np.any(obs_freq > self._table_freqs[-1]):
+            raise ValueError(f'Frequency out of the range of the '
+                             f'atmospheric model: {obs_freq} GHz')
+        if not weathers[0] <= weather <= weathers[-1]:
+            raise ValueError(f'Weather out of the range of the '
+                             f'atmospheric model: {weather}')
+
+        i = min(int(np.searchsorted(weathers, weather, side='right')) - 1,
+                len(weathers) - 2)
+        weather_low = weathers[i]
+        weather_upp = weathers[i + 1]
+        frac = (weather - weather_low) / (weather_upp - weather_low)
+
+        value_low = np.interp(obs_freq, self._table_freqs,
+                              columns[weather_low])
+        value_upp = np.interp(obs_freq, self._table_freqs,
+                              columns[weather_upp])
+
+        return (1 - frac) * value_low + frac * value_upp
+
+    def band_frequencies(self, obs_freq_low, obs_freq_upp):
+        """
+        Get the frequencies in the ATM tables that lie within a band,
+        padded with the lower and upper band edges
+
+        :param obs_freq_low: the lower edge of the band in GHz
+        :type obs_freq_low: float
+        :param obs_freq_upp: the upper edge of the band in GHz
+        :type obs_freq_upp: float
+        :return: the band edges and the table frequencies between them in GHz
+        :rtype: numpy.ndarray
+        """
+        i_low = np.searchsorted(self._table_freqs, obs_freq_low, side='right')
+        i_upp = np.searchsorted(self._table_freqs, obs_freq_upp, side='left')
 
+        return np.concatenate(([obs_freq_low],
+                               self._table_freqs[i_low:i_upp],
+                               [obs_freq_upp]))
 
     def calculate_tau_atm(self, obs_freq, weather, elevation):
         """
         Calculate the atmospheric tau factor tau_atm
 
-        :param obs_freq: the central observing frequency
+        :param obs_freq: the central observing frequency, or an array of
+            frequencies
         :type obs_freq: astropy.units.Quantity
         :param weather: the precipitable water vapour
         :type weather: float
         :param elevation: elevation of the target
         :type elevation: astropy.units.Quantity
-        :return: Atmospheric transmittance
-        :rtype: astropy.units.Quantity
+        :return: Atmospheric transmittance (an array if `obs_freq` is an
+            array)
+        :rtype: float or numpy.ndarray
         """
-        tau_z = self._interp_tau_atm((obs_freq, weather))
+        tau_z = self._interpolate(self._tau_atm_by_weather, obs_freq, weather)
         zenith = 90.0 * u.deg - elevation
         tau_atm = tau_z / np.cos(zenith)
 
-        return float(tau_atm)
+        if np.ndim(tau_atm) == 0:
+            return float(tau_atm)
+
+        return tau_atm.value
 
     def calculate_atmospheric_temperature(self, obs_freq, weather):
         """
         Calculate the atmospheric temperature T_atm
 
-        :param obs_freq: the central observing frequency
+        :param obs_freq: the central observing frequency, or an array of
+            frequencies
         :type obs_freq: astropy.units.Quantity
         :param weather: the precipitable water vapour
         :type weather: float
-        :return: Atmospheric temperature
+        :return: Atmospheric temperature (an array if `obs_freq` is an array)
         :rtype: astropy.units.Quantity
         """
-        return float(self._interp_T_atm((obs_freq, weather))) * u.K
+        T_atm = self._interpolate(self._T_atm_by_weather, obs_freq, weather)
+
+        if np.ndim(T_atm) == 0:
+            return float(T_atm) * u.K
+
+        return T_atm * u.K
 
 
 class Efficiencies:
@@ -146,9 +253,13 @@ class Efficiencies:
 
 class Temperatures:
     """
-    Calculates temperature terms
+    Calculates temperature terms. The observing frequency, T_atm and tau_atm
+    may be arrays, in which case the temperatures are arrays too.
     """
 
+    # h/k_B in K/GHz
+    _H_OVER_K_B = (constants.h / constants.k_B).to(u.K / u.GHz).value
+
     def __init__(self, obs_freq, T_cmb, T_amb, g, eta_eff, T_atm, tau_atm):
         self._T_rx = Temperatures._calculate_receiver_temperature(obs_freq)
         self._T_sys = \
@@ -176,12 +287,44 @@ class Temperatures:
         """
         return self._T_sky
 
+    @staticmethod
+    def calculate_system_temperature(obs_freq, T_cmb, T_amb, g, eta_eff,
+                                     T_atm, tau_atm):
+        """
+        Returns the system temperature using plain floats, or arrays of
+        floats, without creating a Temperatures object. This is used where
+        the temperature is needed for many frequencies at once.
+
+        :param obs_freq: observing frequency in GHz
+        :type obs_freq: float or numpy.ndarray
+        :param T_cmb: temperature of the CMB in K
+        :type T_cmb: float
+        :param T_amb: average ambient temperature in K
+        :type T_amb: float
+        :param g: sideband ratio
+        :type g: float
+        :param eta_eff: forward efficiency
+        :type eta_eff: float
+        :param T_atm: atmospheric temperature in K
+        :type T_atm: float or numpy.ndarray
+        :param tau_atm: atmospheric tau factor
+        :type tau_atm: float or numpy.ndarray
+        :return: system temperature in K
+        :rtype: float or numpy.ndarray
+        """
+        T_rx = Temperatures._receiver_temperature(obs_freq)
+        T_sky = Temperatures._sky_temperature(T_cmb, T_atm, tau_atm)
+
+        return Temperatures._system_temperature(g, eta_eff, T_amb, T_rx,
+                                                T_sky, tau_atm)
+
     @staticmethod
     def _calculate_receiver_temperature(obs_freq):
         """
         Calculate the receiver temperature
         """
-        return (5 * constants.h * obs_freq / constants.k_B).to(u.K)
+        return Temperatures._receiver_temperature(
+            obs_freq.to(u.GHz).value) * u.K
 
     def _calculate_system_temperature(self, g, T_cmb, eta_eff, T_amb,
                                       T_atm, tau_atm):
@@ -192,11 +335,43 @@ class Temperatures:
         :rtype: astropy.units.Quantity
         """
 
+        self._T_sky = Temperatures._sky_temperature(
+            T_cmb.to(u.K).value, T_atm.to(u.K).value, tau_atm) * u.K
+
+        return Temperatures._system_temperature(
+            g, eta_eff, T_amb.to(u.K).value, self.T_rx.to(u.K).value,
+            self._T_sky.value, tau_atm) * u.K
+
+    ############################################################
+    # Temperature formulae, on plain floats (GHz and K) or     #
+    # arrays of floats                                         #
+    ############################################################
+
+    @staticmethod
+    def _receiver_temperature(obs_freq):
+        """
+        Receiver temperature in K, for an observing frequency in GHz
+        """
+        return 5 * Temperatures._H_OVER_K_B * obs_freq
+
+    @staticmethod
+    def _sky_temperature(T_cmb, T_atm, tau_atm):
+        """
+        Sky temperature in K
+        """
+        transmittance = np.exp(-tau_atm)
+
+        return T_atm * (1 - transmittance) + T_cmb
+
+    @staticmethod
+    def _system_temperature(g, eta_eff, T_amb, T_rx, T_sky, tau_atm):
+        """
+        System temperature in K
+        """
         transmittance = np.exp(-tau_atm)
-        self._T_sky = T_atm * (1 - transmittance) + T_cmb
 
         return (1 + g) / (eta_eff * transmittance) * \
-               (self.T_rx
-                + (eta_eff * self._T_sky)
+               (T_rx
+                + (eta_eff * T_sky)
                 + ((1 - eta_eff) * T_amb)
                 )
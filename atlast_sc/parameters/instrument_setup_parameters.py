@@ -8,6 +8,16 @@ class InstrumentSetupParameters:
 
     def __init__(self, config):
         self.config = config
+        # Set when an input to the derived parameters is updated; checked
+        # (and cleared) by the Calculator before its next calculation
+        self._dp_dirty = False
+
+    @property
+    def calculation_inputs(self):
+        """
+        The inputs to the calculation (user input and instrument setup)
+        """
+        return self.config.calculation_inputs
 
     @property
     def g(self):
@@ -9,6 +9,18 @@ class UserInputParameters:
 
     def __init__(self, config):
         self.config = config
+        # Set when an input to the derived parameters is updated; checked
+        # (and cleared) by the Calculator before its next calculation
+        self._dp_dirty = False
+        # Cached product of n_pol and bandwidth
+        self._n_pol_bandwidth = None
+
+    @property
+    def calculation_inputs(self):
+        """
+        The inputs to the calculation (user input and instrument setup)
+        """
+        return self.config.calculation_inputs
 
     # TODO t_int and sensitivity are a special can se. They can be both
     #   set and calculated. Special care needs to be taken on setting them:
@@ -74,6 +86,7 @@ class UserInputParameters:
     def bandwidth(self, value):
         self.config.calculation_inputs.user_input.bandwidth.value = value
         self.config.calculation_inputs.user_input.bandwidth.unit = value.unit
+        self._clear_n_pol_bandwidth()
 
     @property
     def obs_freq(self):
@@ -99,6 +112,24 @@ class UserInputParameters:
     @Decorators.validate_value
     def n_pol(self, value):
         self.config.calculation_inputs.user_input.n_pol.value = value
+        self._clear_n_pol_bandwidth()
+
+    @property
+    def n_pol_bandwidth(self):
+        """
+        Get the product of the number of polarisations and the bandwidth,
+        as used in the sensitivity and integration time calculations
+        """
+        if self._n_pol_bandwidth is None:
+            self._n_pol_bandwidth = self.n_pol * self.bandwidth
+        return self._n_pol_bandwidth
+
+    def _clear_n_pol_bandwidth(self):
+        """
+        Clear the cached product of n_pol and bandwidth, e.g., after
+        either value has changed
+        """
+        self._n_pol_bandwidth = None
 
     @property
     def weather(self):
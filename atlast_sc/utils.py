@@ -47,7 +47,8 @@ class Decorators:
         """
         Decorator to support setter methods on calculations input parameters
         that input to the derived parameters. Validates the value for the
-        target parameter and recalculates derived parameters where necessary.
+        target parameter and flags the derived parameters for recalculation
+        where necessary.
 
         :param func: function that updates the calculation input parameter
         :type func: property setter function
@@ -58,7 +59,8 @@ class Decorators:
             """
             Validates the type, value and units of the value for the target
             parameter. If the new value is different from the old, derived
-            parameters are recalculated.
+            parameters are flagged to be recalculated before the next
+            sensitivity or integration time calculation.
 
             :param calculator: The Calculator object
             :type calculator: Calculator
@@ -81,9 +83,11 @@ class Decorators:
             # Update the parameter
             func(calculator, value, **kwargs)
 
-            # Recalculate derived parameters, if necessary
+            # Flag the derived parameters for recalculation, if necessary.
+            # The flag is set on the object holding the parameter, and is
+            # picked up by the Calculator before its next calculation
             if dirty:
-                calculator._calculate_derived_parameters()
+                calculator._dp_dirty = True
 
         return do_update
 
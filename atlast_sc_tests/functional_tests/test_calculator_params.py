@@ -1,4 +1,3 @@
-from scipy.stats import linregress
 import numpy as np
 import pytest
 from pydantic import ValidationError
@@ -228,9 +227,9 @@ class TestDerivedGroups:
         # with the band
         x = np.arange(1, len(band_temps)+1)
         y = np.array(band_temps)
-        res = linregress(x, y)
-        # print(f'Equation: {res[0]:.3f} * x + {res[1]:.3f}')
-        assert res[0] > 1
+        slope, intercept = np.polyfit(x, y, 1)
+        # print(f'Equation: {slope:.3f} * x + {intercept:.3f}')
+        assert slope > 1
 
     def test_eta_a(self, surface_rms, eta_ill, eta_spill, eta_block, eta_pol):
         test_obs_freqs = \
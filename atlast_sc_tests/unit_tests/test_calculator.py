@@ -1,5 +1,6 @@
 import copy
 import pytest
+import numpy as np
 import astropy.units as u
 from atlast_sc.calculator import Calculator, Config
 from atlast_sc.models import DerivedParams, CalculationInput
@@ -141,8 +142,9 @@ class TestCalculator:
             validation_spy.assert_called()
             # Verify that the parameter was updated
             assert getattr(calculator, param) == new_value
-            # Verify that the derived parameters were updated,
-            # where appropriate
+            # Verify that the derived parameters were updated, where
+            # appropriate
+            calculator._update_derived_parameters()
             if derived_params_recalculated:
                 if finetuned:
                     calculate_derived_params_spy.assert_called()
@@ -173,13 +175,74 @@ class TestCalculator:
         # reset the calculator
         calculator.reset()
         assert calculator.obs_freq == obs_freq
-        # Verify that the derived parameters were recalculated
+        # Verify that the derived parameters are recalculated before the
+        # next calculation
+        assert calculator._dp_dirty
+        calculator.calculate_sensitivity(update_calculator=False)
         calculate_derived_params_spy.assert_called()
         assert calculator.derived_parameters == original_derived_params
         # Verify that the reset function resets the values stored in the
         # Calculator's config object
         config_reset_spy.assert_called()
 
+    def test_reset_defers_recalculation(self, calculator, mocker):
+
+        calculate_derived_params_spy = \
+            mocker.spy(Calculator, '_calculate_derived_parameters')
+
+        # Verify that resetting the calculator doesn't recalculate the
+        # derived parameters straight away
+        calculator.reset()
+        calculate_derived_params_spy.assert_not_called()
+
+        # Verify that they are recalculated (once) when they are next needed
+        calculator.calculate_sensitivity(update_calculator=False)
+        calculator.calculate_t_integration(update_calculator=False)
+        calculate_derived_params_spy.assert_called_once()
+        assert not calculator._dp_dirty
+
+    @pytest.mark.parametrize(
+        'params,param,new_value,new_input',
+        [
+            ('_uip', 'obs_freq', 700 * u.GHz,
+             ({'obs_freq': {'value': 700, 'unit': 'GHz'}}, {})),
+            ('_uip', 'bandwidth', 1 * u.GHz,
+             ({'bandwidth': {'value': 1, 'unit': 'GHz'}}, {})),
+            ('_uip', 'weather', 50.0, ({'weather': {'value': 50}}, {})),
+            ('_uip', 'elevation', 80 * u.deg,
+             ({'elevation': {'value': 80, 'unit': 'deg'}}, {})),
+            ('_isp', 'dish_radius', 30 * u.m,
+             ({}, {'dish_radius': {'value': 30, 'unit': 'm'}})),
+        ]
+    )
+    def test_update_recalculates_derived_parameters(self, params, param,
+                                                    new_value, new_input,
+                                                    calculator):
+
+        original_sensitivity = \
+            calculator.calculate_sensitivity(update_calculator=False)
+
+        # Update the input through the parameter object that holds it
+        setattr(getattr(calculator, params), param, new_value)
+
+        # Verify that the next calculation uses the updated input
+        sensitivity = calculator.calculate_sensitivity(update_calculator=False)
+        expected_sensitivity = Calculator(*new_input) \
+            .calculate_sensitivity(update_calculator=False)
+        assert sensitivity != original_sensitivity
+        assert sensitivity == expected_sensitivity
+        assert not getattr(calculator, params)._dp_dirty
+
+    def test_n_pol_bandwidth(self, n_pol, bandwidth, calculator):
+
+        # Verify that the cached product matches the input values
+        assert calculator._uip.n_pol_bandwidth == n_pol * bandwidth
+
+        # Verify that the cached product is cleared on reset
+        calculator._uip._n_pol_bandwidth = 0 * u.MHz
+        calculator.reset()
+        assert calculator._uip.n_pol_bandwidth == n_pol * bandwidth
+
     @pytest.mark.parametrize(
         'new_t_int,update_calculator',
         [
@@ -293,6 +356,27 @@ class TestCalculator:
         # units of time
         assert any(int_time.unit == x for x in [u.s, u.min, u.h])
 
+    def test_calculate_batch(self, t_int, sensitivity, calculator):
+
+        t_ints = [1, 10, 100] * u.s
+        sensitivities = [0.1, 1, 10] * u.mJy
+
+        sens = calculator.calculate_sensitivity_batch(t_ints)
+        int_times = calculator.calculate_t_integration_batch(sensitivities)
+
+        assert sens.unit == u.mJy
+        assert int_times.unit == u.s
+        assert sens.shape == t_ints.shape
+        assert int_times.shape == sensitivities.shape
+
+        # Verify that the results are consistent with each other
+        assert calculator.calculate_t_integration_batch(sens).value == \
+            pytest.approx(t_ints.value)
+
+        # Verify that the calculator has not been updated
+        assert calculator._uip.t_int == t_int
+        assert calculator.sensitivity == sensitivity
+
     @pytest.mark.parametrize(
         'input_value,func_name',
         [
@@ -340,6 +424,41 @@ class TestCalculator:
         assert round(sensitivity.value, 10) == \
                round(calculator.sensitivity.value, 10)
 
+    def test_calculate_sefd_band(self, t_sys, eta_a, calculator):
+        # For channels with the same system temperature, the effective
+        # SEFD of the band should equal the single-channel SEFD
+        sefd_band = Calculator._calculate_sefd_band(
+            np.full(4, t_sys.to(u.K).value), np.array([1., 2., 3., 4.]),
+            eta_a, calculator._two_kB_over_area, 10.)
+
+        sefd = calculator._calculate_sefd(t_sys, eta_a)
+        assert sefd_band == pytest.approx(sefd.to(u.J / u.m**2).value)
+
+    @pytest.mark.parametrize(
+        'value,expected_unit',
+        [
+            (0.5 * u.mJy, u.uJy),
+            (1 * u.mJy, u.mJy),
+            (999 * u.mJy, u.mJy),
+            (1000 * u.mJy, u.Jy),
+            (59 * u.s, u.s),
+            (1 * u.min, u.min),
+            (3600 * u.s, u.h),
+        ]
+    )
+    def test_to_convenient_unit(self, value, expected_unit):
+        if value.unit.physical_type == 'time':
+            units = Calculator._T_INT_UNITS
+            thresholds = Calculator._T_INT_THRESHOLDS
+        else:
+            units = Calculator._SENSITIVITY_UNITS
+            thresholds = Calculator._SENSITIVITY_THRESHOLDS
+
+        converted = Calculator._to_convenient_unit(value, units, thresholds)
+
+        assert converted.unit == expected_unit
+        assert converted == value
+
 
 class TestConfig:
 
@@ -363,4 +482,30 @@ class TestConfig:
 
         # Check that all the config properties are correctly mapped
         assert config.calculation_inputs == config._calculation_inputs
-        assert config._original_inputs == config._calculation_inputs
+        assert config._original_user_input == input_data
+        assert config._original_instrument_setup == {}
+
+    def test_reset(self, obs_freq):
+
+        config = Config()
+        original_inputs = copy.deepcopy(config.calculation_inputs)
+
+        # update the config
+        config.calculation_inputs.user_input.obs_freq.value = 850 * u.GHz
+
+        # reset the config, and make sure the original values are restored
+        config.reset()
+        assert config.calculation_inputs.user_input.obs_freq.value == obs_freq
+        assert config.calculation_inputs == original_inputs
+
+    def test_reset_after_input_modified(self):
+
+        user_input = {'obs_freq': {'value': 300, 'unit': 'GHz'}}
+        config = Config(user_input)
+
+        # Modify the caller's dictionary after the config has been created,
+        # and make sure resetting the config restores the original value
+        user_input['obs_freq']['value'] = 700
+        config.reset()
+        assert config.calculation_inputs.user_input.obs_freq.value == \
+            300 * u.GHz
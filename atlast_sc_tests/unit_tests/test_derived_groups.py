@@ -1,3 +1,6 @@
+import pytest
+import numpy as np
+import astropy.units as u
 from atlast_sc.derived_groups import AtmosphereParams, Temperatures, \
     Efficiencies
 
@@ -9,6 +12,53 @@ class TestAtmosphereParams:
         # Nothing to test here
         assert True
 
+    def test_array_valued_frequency(self, weather, elevation,
+                                    atmosphere_params):
+
+        freqs = [100, 345, 650] * u.GHz
+
+        tau_atm = atmosphere_params.calculate_tau_atm(freqs, weather,
+                                                      elevation)
+        T_atm = atmosphere_params.calculate_atmospheric_temperature(freqs,
+                                                                    weather)
+
+        # Check that the array results match the single-frequency results
+        for i, freq in enumerate(freqs):
+            assert tau_atm[i] == pytest.approx(
+                atmosphere_params.calculate_tau_atm(freq, weather, elevation))
+            assert T_atm[i].value == pytest.approx(
+                atmosphere_params.calculate_atmospheric_temperature(
+                    freq, weather).value)
+
+    @pytest.mark.parametrize(
+        'obs_freq,weather',
+        [
+            (2500 * u.GHz, 25),
+            (100 * u.GHz, 100),
+        ]
+    )
+    def test_out_of_range(self, obs_freq, weather, elevation,
+                          atmosphere_params):
+        # Verify that values outside the atmospheric model are rejected
+        with pytest.raises(ValueError):
+            atmosphere_params.calculate_tau_atm(obs_freq, weather, elevation)
+        with pytest.raises(ValueError):
+            atmosphere_params.calculate_atmospheric_temperature(obs_freq,
+                                                                weather)
+
+    def test_band_frequencies(self, atmosphere_params):
+
+        freqs = atmosphere_params.band_frequencies(99.95, 100.05)
+
+        # Check that the band edges are included, and that only the table
+        # frequencies strictly within the band are selected
+        table_freqs = atmosphere_params.tau_atm_table[:, 0]
+        expected_freqs = table_freqs[(table_freqs > 99.95)
+                                     & (table_freqs < 100.05)]
+        assert freqs[0] == 99.95
+        assert freqs[-1] == 100.05
+        assert np.array_equal(freqs[1:-1], expected_freqs)
+
 
 class TestEfficiencies:
 
@@ -63,3 +113,14 @@ class TestTemperatures:
             temperatures._calculate_system_temperature(g, t_cmb, eta_eff,
                                                        t_amb, T_atm, tau_atm)
         assert expected_system_temperature == temperatures.T_sys
+
+    def test_calculate_system_temperature(self, obs_freq, t_cmb, t_amb, g,
+                                          eta_eff, t_atm, tau_atm,
+                                          temperatures):
+
+        T_sys = Temperatures.calculate_system_temperature(
+            obs_freq.to(u.GHz).value, t_cmb.to(u.K).value,
+            t_amb.to(u.K).value, g, eta_eff, t_atm.to(u.K).value, tau_atm)
+
+        # Check that the float calculation matches the Quantity calculation
+        assert T_sys == pytest.approx(temperatures.T_sys.to(u.K).value)
@@ -14,6 +14,7 @@ class TestDecorators:
         def __init__(self):
             self._value = 1
             self._quantity = 1 * u.GHz
+            self._dp_dirty = False
             self._calculation_inputs = \
                 TestDecorators.MockCalculator.MockCalculationInputs()
 
@@ -59,10 +60,6 @@ class TestDecorators:
         def calculation_inputs(self):
             return self._calculation_inputs
 
-        @staticmethod
-        def _calculate_derived_parameters():
-            pass
-
     @staticmethod
     def mock_validate(*args):
         if args[2] == 'invalid':
@@ -121,10 +118,6 @@ class TestDecorators:
             mocker.patch(__name__ + '.DataHelper.validate',
                          side_effect=TestDecorators.mock_validate)
 
-        calculate_derived_params_spy = \
-            mocker.spy(TestDecorators.MockCalculator,
-                       '_calculate_derived_parameters')
-
         with expect_raises:
             mock_calculator.decorated_validate_and_update_params = new_value
             validate_mock\
@@ -142,12 +135,9 @@ class TestDecorators:
             assert mock_calculator.decorated_validate_and_update_params == \
                    1 * u.GHz
 
-        # Check that the params were recalculated if the new value differs from
-        # the old
-        if expect_params_recalculated:
-            calculate_derived_params_spy.assert_called_once()
-        else:
-            calculate_derived_params_spy.assert_not_called()
+        # Check that the params were flagged for recalculation if the new
+        # value differs from the old
+        assert mock_calculator._dp_dirty == expect_params_recalculated
 
 
 class TestFileHelper:
@@ -53,6 +53,14 @@ def get_param_values_units():
     return param_values_units
 
 
+def warm_up():
+    """
+    Create a calculator with the default parameters, so that the atmospheric
+    model lookup tables are loaded and cached before the first request
+    """
+    Calculator()
+
+
 def _create_calculater(user_input):
     """
     Create a calculator object with the specified user input
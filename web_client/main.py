@@ -35,6 +35,12 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/scripts", StaticFiles(directory="scripts"), name="scripts")
 
 
+@app.on_event("startup")
+async def warm_up_calculator():
+    # Load the atmospheric model up front, rather than on the first request
+    calculator.warm_up()
+
+
 @app.get("/", response_class=HTMLResponse, include_in_schema=False)
 async def sensitivity_calculator(request: Request):
     return templates.TemplateResponse("sensitivity_calculator.html",